@@ -1,6 +1,6 @@
 import calendar
 import time
-from wsgiref.handlers import format_date_time
+from bisect import bisect_right
 from datetime import timezone
 from datetime import datetime
 from datetime import date
@@ -22,9 +22,8 @@ def utc_today() -> date:
 
 
 def utc_truncate_epoch_day(ts: int) -> int:
-    dt = datetime.fromtimestamp(ts, timezone.utc)
-    dt = dt.replace(hour=0, minute=0, second=0, microsecond=0)
-    return epoch_s(dt)
+    # Unix time has no leap seconds, so every UTC day is exactly 86400s
+    return ts - ts % 86400
 
 
 def utc_from_timestamp(ts: int):
@@ -52,6 +51,10 @@ def datetime_end_of_day(day: date) -> datetime:
 ##################
 # Quarter operations
 ##################
+# Quarters end in Mar, Jun, Sep and Dec, none of which depend on leap years
+_QUARTER_END_DAY = (31, 30, 30, 31)
+
+
 def date_to_quarter(dt: date) -> int:
     return ((dt.month - 1) // 3) + 1
 
@@ -68,25 +71,25 @@ def start_of_quarter(year: int, q: int) -> datetime:
     return datetime(year, (q - 1) * 3 + 1, 1)
 
 
-def end_of_quarter(year: int, q: int):
+def end_of_quarter(year: int, q: int) -> datetime:
     """
     Get the end of the quarter
     """
-    return datetime(year, q * 3, 1, 23, 59, 59)
+    if not 1 <= q <= 4:
+        raise ValueError(f"Quarter must be between 1 and 4, got {q}")
+    return datetime(year, q * 3, _QUARTER_END_DAY[q - 1], 23, 59, 59)
 
 
 def generate_quarters(until_year=1970, until_q=1):
+    if not 1 <= until_q <= 4:
+        raise ValueError(f"Quarter must be between 1 and 4, got {until_q}")
     today = date.today()
-    current_quarter = date_to_quarter(today)
-    current_year = today.year
-    for year in generate_years(until=until_year):
-        for q in range(4, 0, -1):
-            if year == current_year and q > current_quarter:
-                continue
-            if year == until_year and until_q > q:
-                return
-            else:
-                yield q, year
+    # count in quarters since year 0 so the loop is a single range
+    start = today.year * 4 + date_to_quarter(today) - 1
+    stop = until_year * 4 + until_q - 1
+    for ordinal in range(start, stop - 1, -1):
+        year, q = divmod(ordinal, 4)
+        yield q + 1, year
 
 
 ##################
@@ -121,15 +124,15 @@ def end_of_month(year, month):
 
 
 def generate_months(until_year=1970, until_m=1):
+    if not 1 <= until_m <= 12:
+        raise ValueError(f"Month must be between 1 and 12, got {until_m}")
     today = date.today()
-    for year in generate_years(until=until_year):
-        for month in range(12, 0, -1):
-            if year == today.year and month > today.month:
-                continue
-            if year == until_year and until_m > month:
-                return
-            else:
-                yield month, year
+    # count in months since year 0 so the loop is a single range
+    start = today.year * 12 + today.month - 1
+    stop = until_year * 12 + until_m - 1
+    for ordinal in range(start, stop - 1, -1):
+        year, month = divmod(ordinal, 12)
+        yield month + 1, year
 
 
 ##################
@@ -157,50 +160,48 @@ def _ts_difference(timestamp: int | datetime | None = None, now_override=None):
         diff = now - datetime.fromtimestamp(timestamp)
     elif isinstance(timestamp, datetime):
         diff = now - timestamp
-    elif not time:
+    elif not timestamp:
         diff = now - now
     return diff
 
 
-def pretty_date(timestamp=None, now_override=None):  # NOQA
+# (upper bound in seconds, unit in seconds, template); a unit of 0 means
+# the template is used as is. The last bucket has no upper bound.
+_PRETTY_DATE_BUCKETS = (
+    (10, 0, "just now"),
+    (60, 1, "{} seconds ago"),
+    (120, 0, "a minute ago"),
+    (3600, 60, "{} minutes ago"),
+    (7200, 0, "an hour ago"),
+    (86400, 3600, "{} hours ago"),
+    (2 * 86400, 0, "Yesterday"),
+    (7 * 86400, 86400, "{} days ago"),
+    (31 * 86400, 7 * 86400, "{} weeks ago"),
+    (365 * 86400, 30 * 86400, "{} months ago"),
+    (None, 365 * 86400, "{} years ago"),
+)
+_PRETTY_DATE_LIMITS = tuple(limit for limit, _, _ in _PRETTY_DATE_BUCKETS[:-1])
+
+
+def pretty_date(timestamp=None, now_override=None):
     """
     Adapted from
     http://stackoverflow.com/questions/1551382/
     user-friendly-time-format-in-python
     """
     diff = _ts_difference(timestamp, now_override)
-    second_diff = diff.seconds
-    day_diff = diff.days
-
-    if day_diff < 0:
+    seconds = diff.days * 86400 + diff.seconds
+    if seconds < 0:
         return ""
-    elif day_diff == 0:
-        if second_diff < 10:
-            return "just now"
-        if second_diff < 60:
-            return str(second_diff) + " seconds ago"
-        if second_diff < 120:
-            return "a minute ago"
-        if second_diff < 3600:
-            return str(second_diff / 60) + " minutes ago"
-        if second_diff < 7200:
-            return "an hour ago"
-        if second_diff < 86400:
-            return str(second_diff / 3600) + " hours ago"
-    elif day_diff == 1:
-        return "Yesterday"
-    elif day_diff < 7:
-        return str(day_diff) + " days ago"
-    elif day_diff < 31:
-        return str(day_diff / 7) + " weeks ago"
-    elif day_diff < 365:
-        return str(day_diff / 30) + " months ago"
-    return str(day_diff / 365) + " years ago"
+    _, unit, template = _PRETTY_DATE_BUCKETS[bisect_right(_PRETTY_DATE_LIMITS, seconds)]
+    return template.format(seconds // unit) if unit else template
 
 
 def httpdate(date_time: datetime) -> str:
     """
     Convert a datetime object to an HTTP date string
     """
-    stamp = time.mktime(date_time.timetuple())
-    return format_date_time(stamp)
+    # email.utils pulls in most of the email package; only pay for it here
+    from email.utils import format_datetime
+
+    return format_datetime(date_time.astimezone(timezone.utc), usegmt=True)
@@ -1,6 +1,7 @@
 from freezegun import freeze_time
+from itertools import zip_longest
 import datetime
-import pytz
+import pytest
 
 from dateutils.dateutils import (
     date_to_quarter,
@@ -12,10 +13,13 @@ from dateutils.dateutils import (
     start_of_year,
     end_of_year,
     epoch_s,
+    utc_truncate_epoch_day,
     datetime_end_of_day,
     datetime_start_of_day,
     httpdate,
+    pretty_date,
     start_of_quarter,
+    end_of_quarter,
 )
 
 
@@ -23,6 +27,12 @@ def test_epoch_s():
     assert 1397488604 == epoch_s(datetime.datetime(2014, 4, 14, 15, 16, 44))
 
 
+def test_utc_truncate_epoch_day():
+    assert 1711584000 == utc_truncate_epoch_day(1711639845)
+    assert 1711584000 == utc_truncate_epoch_day(1711584000)
+    assert -86400 == utc_truncate_epoch_day(-1)
+
+
 def test_datetime_start_of_day():
     day = datetime.datetime(2016, 11, 23, 5, 4, 3).date()
     assert datetime_start_of_day(day) == datetime.datetime(2016, 11, 23, 0, 0, 0)
@@ -48,7 +58,7 @@ def test_generate_years():
 
 @freeze_time("2018-9-12")
 def test_generate_quarters():
-    assert [
+    expected = [
         (3, 2018),
         (2, 2018),
         (1, 2018),
@@ -59,12 +69,15 @@ def test_generate_quarters():
         (4, 2016),
         (3, 2016),
         (2, 2016),
-    ] == list(generate_quarters(until_year=2016, until_q=2))
+    ]
+    quarters = generate_quarters(until_year=2016, until_q=2)
+    for actual, want in zip_longest(quarters, expected):
+        assert actual == want
 
 
 @freeze_time("2018-9-12")
 def test_generate_months():
-    assert [
+    expected = [
         (9, 2018),
         (8, 2018),
         (7, 2018),
@@ -79,7 +92,22 @@ def test_generate_months():
         (10, 2017),
         (9, 2017),
         (8, 2017),
-    ] == list(generate_months(until_year=2017, until_m=8))
+    ]
+    months = generate_months(until_year=2017, until_m=8)
+    for actual, want in zip_longest(months, expected):
+        assert actual == want
+
+
+@pytest.mark.parametrize("until_q", [0, 5, -1])
+def test_generate_quarters_invalid_quarter(until_q):
+    with pytest.raises(ValueError):
+        list(generate_quarters(until_year=2017, until_q=until_q))
+
+
+@pytest.mark.parametrize("until_m", [0, 13, 14])
+def test_generate_months_invalid_month(until_m):
+    with pytest.raises(ValueError):
+        list(generate_months(until_year=2017, until_m=until_m))
 
 
 @freeze_time("2018-9-12")
@@ -90,50 +118,101 @@ def test_generate_weeks():
     ] == list(generate_weeks(count=2))
 
 
-def test_date_to_quarter():
-    def to_date(m, d):
-        return datetime.datetime(2018, m, d)
+@pytest.mark.parametrize(
+    "month,day,expected",
+    [
+        (1, 6, 1),
+        (3, 31, 1),
+        (4, 1, 2),
+        (6, 30, 2),
+        (7, 30, 3),
+        (9, 3, 3),
+        (10, 1, 4),
+        (12, 31, 4),
+    ],
+)
+def test_date_to_quarter(month, day, expected):
+    assert expected == date_to_quarter(datetime.datetime(2018, month, day))
+
+
+@pytest.mark.parametrize(
+    "month,day,expected_month",
+    [
+        (1, 6, 1),
+        (3, 31, 1),
+        (4, 1, 4),
+        (6, 30, 4),
+        (7, 30, 7),
+        (9, 3, 7),
+        (10, 1, 10),
+        (12, 31, 10),
+    ],
+)
+def test_date_to_start_of_quarter(month, day, expected_month):
+    expected = datetime.datetime(2018, expected_month, 1)
+    assert expected == date_to_start_of_quarter(datetime.datetime(2018, month, day))
 
-    assert 1 == date_to_quarter(to_date(1, 6))
-    assert 1 == date_to_quarter(to_date(3, 31))
 
-    assert 2 == date_to_quarter(to_date(4, 1))
-    assert 2 == date_to_quarter(to_date(6, 30))
+def test_start_of_quarter():
+    assert start_of_quarter(2024, 1) == datetime.datetime(2024, 1, 1)
 
-    assert 3 == date_to_quarter(to_date(7, 30))
-    assert 3 == date_to_quarter(to_date(9, 3))
 
-    assert 4 == date_to_quarter(to_date(10, 1))
-    assert 4 == date_to_quarter(to_date(12, 31))
+@pytest.mark.parametrize(
+    "q,expected",
+    [
+        (1, datetime.datetime(2024, 3, 31, 23, 59, 59)),
+        (2, datetime.datetime(2024, 6, 30, 23, 59, 59)),
+        (3, datetime.datetime(2024, 9, 30, 23, 59, 59)),
+        (4, datetime.datetime(2024, 12, 31, 23, 59, 59)),
+    ],
+)
+def test_end_of_quarter(q, expected):
+    assert expected == end_of_quarter(2024, q)
 
 
-def test_date_to_start_of_quarter():
-    def to_date(m, d):
-        return datetime.datetime(2018, m, d)
+@pytest.mark.parametrize("q", [0, 5])
+def test_end_of_quarter_invalid(q):
+    with pytest.raises(ValueError):
+        end_of_quarter(2024, q)
 
-    q1 = to_date(1, 1)
-    q2 = to_date(4, 1)
-    q3 = to_date(7, 1)
-    q4 = to_date(10, 1)
 
-    assert q1 == date_to_start_of_quarter(to_date(1, 6))
-    assert q1 == date_to_start_of_quarter(to_date(3, 31))
+def test_httpdate():
+    dt = datetime.datetime(2014, 4, 14, 15, 16, 44, tzinfo=datetime.timezone.utc)
+    assert "Mon, 14 Apr 2014 15:16:44 GMT" == httpdate(dt)
 
-    assert q2 == date_to_start_of_quarter(to_date(4, 1))
-    assert q2 == date_to_start_of_quarter(to_date(6, 30))
 
-    assert q3 == date_to_start_of_quarter(to_date(7, 30))
-    assert q3 == date_to_start_of_quarter(to_date(9, 3))
+def test_httpdate_non_utc_timezone():
+    pytz = pytest.importorskip("pytz")
+    tz = pytz.timezone("America/New_York")
+    dt = tz.localize(datetime.datetime(2014, 4, 14, 15, 16, 44))
+    assert "Mon, 14 Apr 2014 19:16:44 GMT" == httpdate(dt)
 
-    assert q4 == date_to_start_of_quarter(to_date(10, 1))
-    assert q4 == date_to_start_of_quarter(to_date(12, 31))
 
+PRETTY_NOW = 1711540800
 
-def test_start_of_quarter():
-    assert start_of_quarter(2024, 1) == datetime.datetime(2024, 1, 1)
 
+def _ago(seconds):
+    return datetime.datetime.fromtimestamp(PRETTY_NOW - seconds)
 
-def test_httpdate():
-    tz = pytz.timezone("America/New_York")
-    dt = tz.localize(datetime.datetime(2014, 4, 14, 15, 16, 44))
-    assert "Mon, 14 Apr 2014 19:16:44 GMT" == httpdate(dt)
+
+@pytest.mark.parametrize(
+    "timestamp,expected",
+    [
+        (_ago(5), "just now"),
+        (_ago(30), "30 seconds ago"),
+        (_ago(90), "a minute ago"),
+        (_ago(330), "5 minutes ago"),
+        (_ago(3600), "an hour ago"),
+        (_ago(9000), "2 hours ago"),
+        (_ago(86400), "Yesterday"),
+        (_ago(3 * 86400), "3 days ago"),
+        (_ago(15 * 86400), "2 weeks ago"),
+        (_ago(95 * 86400), "3 months ago"),
+        (_ago(800 * 86400), "2 years ago"),
+        (_ago(-60), ""),
+        (PRETTY_NOW - 30, "30 seconds ago"),
+        (None, "just now"),
+    ],
+)
+def test_pretty_date(timestamp, expected):
+    assert expected == pretty_date(timestamp, now_override=PRETTY_NOW)